@@ -0,0 +1,62 @@
+# cython: language_level=3
+"""
+Compiled build of _flatten_json from json_triage_to_df_flat.py.
+
+json_triage_to_df_flat.py imports flatten_json from here when the extension
+has been built, and otherwise uses its pure-Python version. Both produce the
+same output. Build in place with:
+
+    cythonize -i _flatten.pyx
+"""
+
+cpdef dict flatten_json(object data, str prefix=''):
+    """
+    Flatten a nested JSON structure into a flat dictionary.
+
+    Args:
+    data (Union[Dict[str, Any], List[Any]]): The JSON data to flatten.
+    prefix (str): The current key prefix for nested structures.
+
+    Returns:
+    Dict[str, Any]: A flattened dictionary representation of the JSON data.
+    """
+    cdef dict flattened = {}
+    cdef list roots, stack
+    cdef str root_key, parent_key, new_key
+    cdef object root, items, key, value, item
+    cdef Py_ssize_t i
+
+    # JSON only produces builtin types, so exact type checks are safe here
+    if type(data) is dict:
+        roots = [(prefix, data)]
+    elif type(data) is list:
+        roots = []
+        for i, item in enumerate(<list>data):
+            roots.append((f"{prefix}[{i}]", item))
+    else:
+        flattened[prefix] = data
+        return flattened
+
+    for root_key, root in roots:
+        if type(root) is list:
+            flattened[root_key] = f"Array[{len(<list>root)}]"
+            continue
+        if type(root) is not dict:
+            flattened[root_key] = root
+            continue
+        stack = [(root_key, iter((<dict>root).items()))]
+        while stack:
+            parent_key, items = stack[-1]
+            for key, value in items:
+                new_key = f"{parent_key}.{key}" if parent_key else key
+                if type(value) is dict:
+                    # Descend; this level resumes once the child is exhausted
+                    stack.append((new_key, iter((<dict>value).items())))
+                    break
+                elif type(value) is list:
+                    flattened[new_key] = f"Array[{len(<list>value)}]"
+                else:
+                    flattened[new_key] = value
+            else:
+                stack.pop()
+    return flattened
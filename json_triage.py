@@ -1,92 +1,235 @@
 import json
 from collections import defaultdict
-from typing import Dict, List, Tuple
+from concurrent.futures import ProcessPoolExecutor
+from itertools import chain
+from operator import itemgetter
+from typing import Any, Dict, List, Optional, Tuple
+import io
+import mmap
 import os
+import pickle
 
-def iterate_json_files(directory: str):
-    for filename in os.listdir(directory):
-        if filename.endswith('.json'):
-            file_path = os.path.join(directory, filename)
-            yield (filename, file_path)
+# Files above this size (in bytes) are memory-mapped rather than read
+MMAP_THRESHOLD = 1 << 20
+
+# Parse results from previous runs, kept in the report directory. Bump
+# CACHE_VERSION whenever the shape of the cached results changes.
+CACHE_VERSION = 2
+CACHE_FILE_NAME = '.json_triage_cache.pkl'
 
-def analyze_json_files(directory: str):
+def iterate_json_files(directory: str):
+    # scandir entries carry the joined path and cached file type, so only the
+    # stat call for size and modification time is left; files are yielded in
+    # listing order
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file():
+                yield (entry.name, entry.path, entry.stat())
+
+# Maps every digit to '0', so runs of digits can be found with a plain
+# substring search
+_DIGITS_TO_ZERO = bytes.maketrans(b'123456789', b'000000000')
+_LONG_DIGIT_RUN = b'0' * 19
+
+# Bytes checked per window by _has_long_integer
+_SCAN_CHUNK = 1 << 20
+
+def _has_long_integer(buf) -> bool:
+    # True if the document may hold an integer literal of 19 or more digits,
+    # which can fall outside the 64-bit range. Digit runs right after '.',
+    # 'e', 'E' or '+' belong to fractions and exponents and are skipped.
+    run = len(_LONG_DIGIT_RUN)
+    # Scanned in windows so a memory-mapped file is never copied whole; each
+    # window also holds the byte before it and the tail of a run crossing its end
+    for start in range(0, len(buf), _SCAN_CHUNK):
+        lo = max(start - 1, 0)
+        digits = bytes(buf[lo:start + _SCAN_CHUNK + run - 1]).translate(_DIGITS_TO_ZERO)
+        i = digits.find(_LONG_DIGIT_RUN, start - lo)
+        while i != -1 and lo + i < start + _SCAN_CHUNK:
+            if lo + i == 0 or digits[i - 1] not in b'0.eE+':
+                return True
+            i = digits.find(_LONG_DIGIT_RUN, i + run)
+    return False
+
+# Pick the fastest JSON parser available: simdjson, then orjson, then the
+# standard library. Each is handed the raw bytes (or a memoryview) of a file.
+try:
+    import simdjson
+
+    # One parser per process, so its internal buffers are reused across
+    # files. Only the top-level keys are read here, so documents are left as
+    # lazy simdjson proxies rather than converted into dicts; each proxy has
+    # to be dropped before the parser is used for the next file.
+    _parser = simdjson.Parser()
+
+    def _loads(buf):
+        return _parser.parse(buf)
+except ImportError:
+    try:
+        import orjson
+    except ImportError:
+        def _loads(buf):
+            return json.loads(bytes(buf))
+    else:
+        def _loads(buf):
+            # orjson returns integers outside the 64-bit range as floats, so
+            # documents that may hold one are parsed with json instead
+            if _has_long_integer(buf):
+                return json.loads(bytes(buf))
+            return orjson.loads(buf)
+
+def parse_json(buf):
+    # orjson and simdjson reject NaN and Infinity, which the standard library
+    # (and json.dump by default) allows, and simdjson raises RuntimeError on
+    # integers wider than 64 bits, so documents they refuse are retried with
+    # json.loads
+    try:
+        return _loads(buf)
+    except (ValueError, RuntimeError):
+        return json.loads(bytes(buf))
+
+def load_json(file_path: str):
+    # Large files are memory-mapped and parsed straight from the page cache
+    with open(file_path, 'rb', buffering=1 << 16) as f:
+        if os.fstat(f.fileno()).st_size > MMAP_THRESHOLD:
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+                return parse_json(view)
+        return parse_json(f.read())
+
+def _parse_one(file_path: str) -> Tuple[str, ...]:
+    # Runs in a worker process. Only the keys are needed here, so the
+    # parsed document is dropped as soon as they have been collected
+    return tuple(load_json(file_path).keys())
+
+def load_cache(cache_path: str) -> Dict[Tuple[str, int, int], Any]:
+    # A missing or unreadable cache just means every file is parsed again
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = pickle.load(f)
+    except Exception:
+        # Unpickling can raise almost anything for a corrupt or foreign file
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+        return {}
+    entries = cache.get('entries')
+    return entries if isinstance(entries, dict) else {}
+
+def save_cache(cache_path: str, cache: Dict[Tuple[str, int, int], Any]) -> None:
+    # Write to a temporary file first so an interrupted run cannot leave a
+    # truncated cache behind
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'version': CACHE_VERSION, 'entries': cache}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+def analyze_json_files(directory: str, cache_path: Optional[str] = None):
     field_frequency = defaultdict(int)
-    missing_fields = defaultdict(list)
-    extra_fields = defaultdict(list)
-    all_fields = set()
     file_structures = defaultdict(list)
 
-    for file_name, file_path in iterate_json_files(directory):
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        fields = set(data.keys())
-        all_fields.update(fields)
-        
-        # Field frequency analysis
-        for field in fields:
-            field_frequency[field] += 1
-        
-        # Store file structure for grouping
-        structure_key = tuple(sorted(fields))
-        file_structures[structure_key].append(file_name)
-
-    total_files = sum(len(files) for files in file_structures.values())
-    common_fields = set(field for field, count in field_frequency.items() if count == total_files)
-
-    # Missing and extra field detection
-    for structure, files in file_structures.items():
-        missing = common_fields - set(structure)
-        extra = set(structure) - common_fields
-        for file in files:
-            if missing:
-                missing_fields[file].extend(missing)
-            if extra:
-                extra_fields[file].extend(extra)
-
-    return field_frequency, missing_fields, extra_fields, file_structures
+    # Results from a previous run are reused for files whose path,
+    # modification time and size are unchanged; only the rest are parsed
+    cache = load_cache(cache_path) if cache_path else {}
+    new_cache = {}
+    files = [(file_name, file_path, (file_path, stat.st_mtime_ns, stat.st_size))
+             for file_name, file_path, stat in iterate_json_files(directory)]
+
+    # Largest files are dispatched first, so they do not end up as the tail
+    # of the parallel run; the first batch goes one file per task so no
+    # worker gets stuck with several large files in one chunk
+    to_parse = [cache_key[0] for cache_key in sorted(
+        (cache_key for _, _, cache_key in files if cache_key not in cache),
+        key=itemgetter(2), reverse=True)]
+    # ProcessPoolExecutor accepts at most 61 workers on Windows
+    max_workers = min(os.cpu_count() or 1, 61)
+
+    # Parse files in parallel; the reductions below stay on the main process
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        parsed = chain(executor.map(_parse_one, to_parse[:max_workers]),
+                       executor.map(_parse_one, to_parse[max_workers:], chunksize=16))
+        # Reduce in listing order, not in the order the files were dispatched
+        results = dict(zip(to_parse, parsed))
+        for file_name, file_path, cache_key in files:
+            fields = cache.get(cache_key)
+            if fields is None:
+                fields = results.pop(file_path)
+            new_cache[cache_key] = fields
+
+            # Field frequency analysis
+            for field in fields:
+                field_frequency[field] += 1
+            
+            # Store file structure for grouping
+            structure_key = tuple(sorted(fields))
+            file_structures[structure_key].append(file_name)
+
+    # Only files seen in this run are kept, so deleted files drop out. The
+    # cache is left alone when no file was parsed or dropped.
+    if cache_path and (to_parse or len(new_cache) != len(cache)):
+        save_cache(cache_path, new_cache)
+
+    # A field is in every file exactly when it is in every distinct structure
+    structure_keys = list(file_structures)
+    common_fields = set(structure_keys[0]).intersection(*structure_keys[1:]) if structure_keys else set()
+
+    # Missing and extra field detection, once per structure
+    structure_differences = {
+        structure: (tuple(common_fields - set(structure)), tuple(set(structure) - common_fields))
+        for structure in file_structures
+    }
+
+    return field_frequency, structure_differences, file_structures
 
 def generate_summary_report(field_frequency: Dict[str, int], 
-                            missing_fields: Dict[str, List[str]], 
-                            extra_fields: Dict[str, List[str]], 
+                            structure_differences: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], Tuple[str, ...]]], 
                             file_structures: Dict[Tuple[str], List[str]]) -> str:
     total_files = sum(len(files) for files in file_structures.values())
-    report = f"JSON Files Analysis Report\n"
-    report += f"Total files analyzed: {total_files}\n\n"
+    buf = io.StringIO()
+    write = buf.write
+    write("JSON Files Analysis Report\n")
+    write(f"Total files analyzed: {total_files}\n\n")
 
-    report += "Field Frequency:\n"
-    for field, count in sorted(field_frequency.items(), key=lambda x: x[1], reverse=True):
-        report += f"  {field}: {count} ({count/total_files*100:.2f}%)\n"
+    write("Field Frequency:\n")
+    for field, count in sorted(field_frequency.items(), key=itemgetter(1), reverse=True):
+        write(f"  {field}: {count} ({count/total_files*100:.2f}%)\n")
 
-    report += "\nMissing Fields:\n"
-    for file, fields in missing_fields.items():
-        report += f"  {file}: {', '.join(fields)}\n"
+    write("\nMissing Fields:\n")
+    for structure, files in file_structures.items():
+        missing = structure_differences[structure][0]
+        if missing:
+            fields = ', '.join(missing)
+            for file in files:
+                write(f"  {file}: {fields}\n")
 
-    report += "\nExtra Fields:\n"
-    for file, fields in extra_fields.items():
-        report += f"  {file}: {', '.join(fields)}\n"
+    write("\nExtra Fields:\n")
+    for structure, files in file_structures.items():
+        extra = structure_differences[structure][1]
+        if extra:
+            fields = ', '.join(extra)
+            for file in files:
+                write(f"  {file}: {fields}\n")
 
-    report += "\nFile Grouping:\n"
+    write("\nFile Grouping:\n")
     for i, (structure, files) in enumerate(file_structures.items(), 1):
-        report += f"  Group {i} ({len(files)} files):\n"
-        report += f"    Fields: {', '.join(structure)}\n"
-        report += f"    Files: {', '.join(files[:5])}{'...' if len(files) > 5 else ''}\n"
+        write(f"  Group {i} ({len(files)} files):\n")
+        write(f"    Fields: {', '.join(structure)}\n")
+        write(f"    Files: {', '.join(files[:5])}{'...' if len(files) > 5 else ''}\n")
 
-    return report
+    return buf.getvalue()
 
 def main(directory: str, report_directory: str):
-    field_frequency, missing_fields, extra_fields, file_structures = analyze_json_files(directory)
-    report = generate_summary_report(field_frequency, missing_fields, extra_fields, file_structures)
-    
-    print(report)
-
     # Create the reports directory if it doesn't exist
     os.makedirs(report_directory, exist_ok=True)
 
+    cache_path = os.path.join(report_directory, CACHE_FILE_NAME)
+    field_frequency, structure_differences, file_structures = analyze_json_files(directory, cache_path)
+    report = generate_summary_report(field_frequency, structure_differences, file_structures)
+    
+    print(report)
+
     # Save the report to a file in the specified directory
     report_file_path = os.path.join(report_directory, 'json_analysis_report.txt')
-    with open(report_file_path, 'w') as f:
-        f.write(report)
+    with open(report_file_path, 'wb', buffering=1 << 20) as f:
+        f.write(report.encode('utf-8'))
     
     print(f"Report saved to: {report_file_path}")
 
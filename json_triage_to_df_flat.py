@@ -1,11 +1,45 @@
 # Import necessary libraries
 import json
 from collections import defaultdict
-from typing import Dict, List, Tuple, Any, Union
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from itertools import chain
+from operator import itemgetter
+from typing import Dict, List, Optional, Tuple, Any, Union
+import io
+import mmap
 import os
+import pickle
+import sys
+import numpy as np
 import pandas as pd
 from datetime import datetime
 
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pacsv
+except ImportError:  # pyarrow is optional; pandas' CSV writer is used instead
+    pa = None
+
+try:
+    import ijson  # Picks the C (yajl2_c) backend when it is available
+except ImportError:  # ijson is optional; large arrays are then loaded whole
+    ijson = None
+
+# Files above this size (in bytes) are memory-mapped rather than read
+MMAP_THRESHOLD = 1 << 20
+
+# Files above this size (in bytes) whose top level is an array are parsed
+# incrementally, one element at a time, when ijson is installed
+STREAM_THRESHOLD = 1 << 26
+
+# Parse results from previous runs, kept in the report directory. Bump
+# CACHE_VERSION whenever the shape of the cached results changes.
+CACHE_VERSION = 2
+CACHE_FILE_NAME = '.json_triage_to_df_flat_cache.pkl'
+
+# Number of group CSVs written concurrently
+CSV_WRITE_WORKERS = 8
+
 def iterate_json_files(directory: str):
     """
     Generator function to iterate over JSON files in a given directory.
@@ -14,16 +48,123 @@ def iterate_json_files(directory: str):
     directory (str): Path to the directory containing JSON files.
     
     Yields:
-    tuple: A tuple containing the filename and full file path for each JSON file.
+    tuple: A tuple containing the filename, full file path and os.stat_result for each JSON file.
+    """
+    # scandir entries carry the joined path and cached file type, so only the
+    # stat call for size and modification time is left; files are yielded in
+    # listing order
+    with os.scandir(directory) as entries:
+        for entry in entries:
+            if entry.name.endswith('.json') and entry.is_file():
+                yield (entry.name, entry.path, entry.stat())
+
+# Maps every digit to '0', so runs of digits can be found with a plain
+# substring search
+_DIGITS_TO_ZERO = bytes.maketrans(b'123456789', b'000000000')
+_LONG_DIGIT_RUN = b'0' * 19
+
+# Bytes checked per window by _has_long_integer
+_SCAN_CHUNK = 1 << 20
+
+def _has_long_integer(buf) -> bool:
+    """
+    Check whether a JSON document may hold an integer literal of 19 or more
+    digits, which can fall outside the 64-bit range.
+    
+    Digit runs right after '.', 'e', 'E' or '+' belong to fractions and
+    exponents and are skipped.
+    
+    Args:
+    buf: The raw bytes of the document, or a memoryview over them.
+    
+    Returns:
+    bool: True if such a literal may be present.
+    """
+    run = len(_LONG_DIGIT_RUN)
+    # Scanned in windows so a memory-mapped file is never copied whole; each
+    # window also holds the byte before it and the tail of a run crossing its end
+    for start in range(0, len(buf), _SCAN_CHUNK):
+        lo = max(start - 1, 0)
+        digits = bytes(buf[lo:start + _SCAN_CHUNK + run - 1]).translate(_DIGITS_TO_ZERO)
+        i = digits.find(_LONG_DIGIT_RUN, start - lo)
+        while i != -1 and lo + i < start + _SCAN_CHUNK:
+            if lo + i == 0 or digits[i - 1] not in b'0.eE+':
+                return True
+            i = digits.find(_LONG_DIGIT_RUN, i + run)
+    return False
+
+# Pick the fastest JSON parser available: simdjson, then orjson, then the
+# standard library. Each is handed the raw bytes (or a memoryview) of a file.
+try:
+    import simdjson
+
+    # One parser per process, so its internal buffers are reused across
+    # files. parse(buf, True) converts the document straight into builtin
+    # dicts and lists, so flatten_json's exact type checks still hold.
+    _parser = simdjson.Parser()
+
+    def _loads(buf):
+        return _parser.parse(buf, True)
+except ImportError:
+    try:
+        import orjson
+    except ImportError:
+        def _loads(buf):
+            return json.loads(bytes(buf))
+    else:
+        def _loads(buf):
+            # orjson returns integers outside the 64-bit range as floats, so
+            # documents that may hold one are parsed with json instead
+            if _has_long_integer(buf):
+                return json.loads(bytes(buf))
+            return orjson.loads(buf)
+
+def parse_json(buf) -> Any:
+    """
+    Parse a JSON document with the fastest available parser.
+    
+    orjson and simdjson reject NaN and Infinity, which the standard library
+    (and json.dump by default) allows, and simdjson raises RuntimeError on
+    integers wider than 64 bits, so documents they refuse are retried with
+    json.loads.
+    
+    Args:
+    buf: The raw bytes of the document, or a memoryview over them.
+    
+    Returns:
+    Any: The parsed JSON data.
     """
-    for filename in os.listdir(directory):
-        if filename.endswith('.json'):
-            file_path = os.path.join(directory, filename)
-            yield (filename, file_path)
+    try:
+        return _loads(buf)
+    except (ValueError, RuntimeError):
+        return json.loads(bytes(buf))
 
-def flatten_json(data: Union[Dict[str, Any], List[Any]], prefix: str = '') -> Dict[str, Any]:
+def read_json(f, size: int) -> Any:
     """
-    Recursively flatten a nested JSON structure into a flat dictionary.
+    Parse an open JSON file from raw bytes with the fastest available parser.
+    
+    Files larger than MMAP_THRESHOLD bytes are memory-mapped and parsed
+    straight from the page cache instead of being copied into a bytes object.
+    
+    Args:
+    f: A binary file object positioned at the start of the file.
+    size (int): Size of the file in bytes.
+    
+    Returns:
+    Any: The parsed JSON data.
+    """
+    if size > MMAP_THRESHOLD:
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm, memoryview(mm) as view:
+            return parse_json(view)
+    return parse_json(f.read())
+
+def _flatten_json(data: Union[Dict[str, Any], List[Any]], prefix: str = '') -> Dict[str, Any]:
+    """
+    Flatten a nested JSON structure into a flat dictionary.
+    
+    Nested objects are walked iteratively with an explicit stack of item
+    iterators, so keys come out in document order and every value is written
+    straight into a single output dictionary.
     
     Args:
     data (Union[Dict[str, Any], List[Any]]): The JSON data to flatten.
@@ -33,128 +174,314 @@ def flatten_json(data: Union[Dict[str, Any], List[Any]], prefix: str = '') -> Di
     Dict[str, Any]: A flattened dictionary representation of the JSON data.
     """
     flattened = {}
-    if isinstance(data, dict):
-        for key, value in data.items():
-            new_key = f"{prefix}.{key}" if prefix else key
-            if isinstance(value, dict):
-                flattened.update(flatten_json(value, new_key))
-            elif isinstance(value, list):
-                flattened[new_key] = f"Array[{len(value)}]"
-            else:
-                flattened[new_key] = value
-    elif isinstance(data, list):
-        for i, item in enumerate(data):
-            new_key = f"{prefix}[{i}]" if prefix else f"[{i}]"
-            if isinstance(item, dict):
-                flattened.update(flatten_json(item, new_key))
-            elif isinstance(item, list):
-                flattened[new_key] = f"Array[{len(item)}]"
-            else:
-                flattened[new_key] = item
+    # JSON only produces builtin types, so exact type checks are safe here
+    if type(data) is dict:
+        roots = ((prefix, data),)
+    elif type(data) is list:
+        roots = ((f"{prefix}[{i}]", item) for i, item in enumerate(data))
     else:
         flattened[prefix] = data
+        return flattened
+
+    for root_key, root in roots:
+        root_type = type(root)
+        if root_type is list:
+            flattened[root_key] = f"Array[{len(root)}]"
+            continue
+        if root_type is not dict:
+            flattened[root_key] = root
+            continue
+        stack = [(root_key, iter(root.items()))]
+        while stack:
+            parent_key, items = stack[-1]
+            for key, value in items:
+                new_key = f"{parent_key}.{key}" if parent_key else key
+                value_type = type(value)
+                if value_type is dict:
+                    # Descend; this level resumes once the child is exhausted
+                    stack.append((new_key, iter(value.items())))
+                    break
+                elif value_type is list:
+                    flattened[new_key] = f"Array[{len(value)}]"
+                else:
+                    flattened[new_key] = value
+            else:
+                stack.pop()
+    return flattened
+
+try:
+    # Compiled build of _flatten_json above, used when _flatten.pyx has been
+    # built with 'cythonize -i _flatten.pyx'
+    from _flatten import flatten_json
+except ImportError:
+    flatten_json = _flatten_json
+
+def _starts_with_array(f) -> bool:
+    """
+    Check whether the first non-whitespace byte of a binary file is '['.
+    
+    Args:
+    f: A binary file object positioned at the start of the file.
+    
+    Returns:
+    bool: True if the JSON document's top level is an array.
+    """
+    while True:
+        chunk = f.read(1 << 12)
+        if not chunk:
+            return False
+        chunk = chunk.lstrip(b' \t\r\n')
+        if chunk:
+            return chunk[:1] == b'['
+
+def flatten_json_array_stream(f) -> Dict[str, Any]:
+    """
+    Incrementally parse and flatten a JSON file whose top level is an array.
+    
+    Elements are parsed one at a time with ijson and flattened as they
+    arrive, so the whole document is never held in memory. The result is the
+    same as flatten_json on the fully loaded array.
+    
+    Args:
+    f: A binary file object positioned at the start of the file.
+    
+    Returns:
+    Dict[str, Any]: A flattened dictionary representation of the JSON data.
+    """
+    flattened = {}
+    for i, item in enumerate(ijson.items(f, 'item', use_float=True)):
+        item_key = f"[{i}]"
+        item_type = type(item)
+        if item_type is dict:
+            flattened.update(flatten_json(item, item_key))
+        elif item_type is list:
+            flattened[item_key] = f"Array[{len(item)}]"
+        else:
+            flattened[item_key] = item
     return flattened
 
-def analyze_json_files(directory: str):
+def _parse_one(file_path: str) -> Dict[str, Any]:
+    """
+    Load and flatten a single JSON file. Runs in a worker process.
+    
+    Args:
+    file_path (str): Path to the JSON file.
+    
+    Returns:
+    Dict[str, Any]: The flattened data.
+    """
+    with open(file_path, 'rb', buffering=1 << 16) as f:
+        size = os.fstat(f.fileno()).st_size
+        if ijson is not None and size > STREAM_THRESHOLD:
+            is_array = _starts_with_array(f)
+            f.seek(0)
+            if is_array:
+                try:
+                    return flatten_json_array_stream(f)
+                except ijson.JSONError:
+                    # yajl rejects NaN, Infinity and integers wider than 64
+                    # bits, so such documents are loaded whole instead
+                    f.seek(0)
+        return flatten_json(read_json(f, size))
+
+def load_cache(cache_path: str) -> Dict[Tuple[str, int, int], Any]:
+    """
+    Load the parse results saved by a previous run.
+    
+    Args:
+    cache_path (str): Path to the cache file.
+    
+    Returns:
+    Dict[Tuple[str, int, int], Any]: Parse results keyed by (path, mtime in ns, size),
+    or an empty dictionary if the cache is missing, unreadable or from another CACHE_VERSION.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            cache = pickle.load(f)
+    except Exception:
+        # Unpickling can raise almost anything for a corrupt or foreign file
+        return {}
+    if not isinstance(cache, dict) or cache.get('version') != CACHE_VERSION:
+        return {}
+    entries = cache.get('entries')
+    return entries if isinstance(entries, dict) else {}
+
+def save_cache(cache_path: str, cache: Dict[Tuple[str, int, int], Any]) -> None:
+    """
+    Save parse results for the next run.
+    
+    The cache is written to a temporary file first, so an interrupted run
+    cannot leave a truncated cache behind.
+    
+    Args:
+    cache_path (str): Path to the cache file.
+    cache (Dict[Tuple[str, int, int], Any]): Parse results keyed by (path, mtime in ns, size).
+    """
+    tmp_path = cache_path + '.tmp'
+    with open(tmp_path, 'wb') as f:
+        pickle.dump({'version': CACHE_VERSION, 'entries': cache}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp_path, cache_path)
+
+def analyze_json_files(directory: str, cache_path: Optional[str] = None):
     """
     Analyze JSON files in the given directory to extract various statistics and structures.
     
     Args:
     directory (str): Path to the directory containing JSON files.
+    cache_path (Optional[str]): Path to a cache of parse results from previous runs; files
+        whose path, modification time and size are unchanged are not parsed again.
     
     Returns:
     tuple: A tuple containing various analysis results:
         - field_frequency: Dictionary of field occurrences across all files.
-        - missing_fields: Dictionary of files with their missing fields.
-        - extra_fields: Dictionary of files with their extra fields.
+        - structure_differences: Dictionary mapping each structure to its (missing, extra) fields.
         - file_structures: Dictionary grouping files by their structure.
         - file_data: Dictionary containing detailed data for each file group.
     """
-    field_frequency = defaultdict(int)
-    missing_fields = defaultdict(list)
-    extra_fields = defaultdict(list)
-    all_fields = set()
+    field_ids = {}  # Field name -> interned integer id, in first-seen order
+    file_field_ids = []
+    structures = {}  # Packed sorted field ids -> sorted field name tuple
     file_structures = defaultdict(list)
     file_data = defaultdict(list)
 
-    # Iterate through all JSON files in the directory
-    for file_name, file_path in iterate_json_files(directory):
-        with open(file_path, 'r') as f:
-            data = json.load(f)
-        
-        # Flatten the JSON structure
-        flattened_data = flatten_json(data)
-        fields = set(flattened_data.keys())
-        all_fields.update(fields)
-        
-        # Count field occurrences
-        for field in fields:
-            field_frequency[field] += 1
-        
-        # Group files by their structure
-        structure_key = tuple(sorted(fields))
-        file_structures[structure_key].append(file_name)
-        file_data[structure_key].append((file_name, file_path, flattened_data))
-
-    # Calculate total number of files and identify common fields
-    total_files = sum(len(files) for files in file_structures.values())
-    common_fields = set(field for field, count in field_frequency.items() if count == total_files)
+    # Results from a previous run are reused for files whose path,
+    # modification time and size are unchanged; only the rest are parsed
+    cache = load_cache(cache_path) if cache_path else {}
+    new_cache = {}
+    files = [(file_name, file_path, (file_path, stat.st_mtime_ns, stat.st_size))
+             for file_name, file_path, stat in iterate_json_files(directory)]
 
-    # Identify missing and extra fields for each file
-    for structure, files in file_structures.items():
-        missing = common_fields - set(structure)
-        extra = set(structure) - common_fields
-        for file in files:
-            if missing:
-                missing_fields[file].extend(missing)
-            if extra:
-                extra_fields[file].extend(extra)
+    # Largest files are dispatched first, so they do not end up as the tail
+    # of the parallel run; the first batch goes one file per task so no
+    # worker gets stuck with several large files in one chunk
+    to_parse = [cache_key[0] for cache_key in sorted(
+        (cache_key for _, _, cache_key in files if cache_key not in cache),
+        key=itemgetter(2), reverse=True)]
+    # ProcessPoolExecutor accepts at most 61 workers on Windows
+    max_workers = min(os.cpu_count() or 1, 61)
+
+    # Load and flatten all JSON files in the directory in parallel; the
+    # reductions below stay on the main process
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        parsed = chain(executor.map(_parse_one, to_parse[:max_workers]),
+                       executor.map(_parse_one, to_parse[max_workers:], chunksize=16))
+        # Reduce in listing order, not in the order the files were dispatched
+        results = dict(zip(to_parse, parsed))
+        for file_name, file_path, cache_key in files:
+            flattened_data = cache.get(cache_key)
+            if flattened_data is None:
+                flattened_data = results.pop(file_path)
+            # Results are unpickled with fresh key strings for every file,
+            # whether they come from a worker or from the cache; re-keying with
+            # sys.intern makes the files kept in file_data share one string
+            # object per field name
+            flattened_data = dict(zip(map(sys.intern, flattened_data), flattened_data.values()))
+            new_cache[cache_key] = flattened_data
+            # Flattened keys are already unique, so the key view is used
+            # directly rather than copied into a set
+            fields = flattened_data.keys()
+
+            # Intern field names so counting works on integer ids
+            ids = np.fromiter(
+                (field_ids.setdefault(field, len(field_ids)) for field in fields),
+                dtype=np.uint32, count=len(fields))
+            file_field_ids.append(ids)
+            
+            # Group files by their structure, keyed by the packed bytes of the sorted
+            # field ids; the field name tuple is only built for new structures
+            structure_key = np.sort(ids).tobytes()
+            if structure_key not in structures:
+                structures[structure_key] = tuple(sorted(fields))
+            file_structures[structure_key].append(file_name)
+            file_data[structure_key].append((file_name, file_path, flattened_data))
+
+    # Only files seen in this run are kept, so deleted files drop out. The
+    # cache is left alone when no file was parsed or dropped.
+    if cache_path and (to_parse or len(new_cache) != len(cache)):
+        save_cache(cache_path, new_cache)
 
-    return field_frequency, missing_fields, extra_fields, file_structures, file_data
+    # Re-key the groups by their field names
+    file_structures = {structures[key]: files for key, files in file_structures.items()}
+    file_data = {structures[key]: files for key, files in file_data.items()}
+
+    # Count field occurrences in a single pass over the interned ids; the
+    # counts are only needed for the report
+    if file_field_ids:
+        counts = np.bincount(np.concatenate(file_field_ids), minlength=len(field_ids))
+    else:
+        counts = np.zeros(0, dtype=np.intp)
+    field_frequency = dict(zip(field_ids, counts.tolist()))
+
+    # Identify common fields: a field is in every file exactly when it is in
+    # every distinct structure
+    structure_keys = list(file_structures)
+    common_fields = set(structure_keys[0]).intersection(*structure_keys[1:]) if structure_keys else set()
+
+    # Identify missing and extra fields once per structure; every file in a
+    # group shares the same result
+    structure_differences = {
+        structure: (tuple(common_fields - set(structure)), tuple(set(structure) - common_fields))
+        for structure in file_structures
+    }
+
+    return field_frequency, structure_differences, file_structures, file_data
 
 def generate_summary_report(field_frequency: Dict[str, int], 
-                            missing_fields: Dict[str, List[str]], 
-                            extra_fields: Dict[str, List[str]], 
+                            structure_differences: Dict[Tuple[str, ...], Tuple[Tuple[str, ...], Tuple[str, ...]]], 
                             file_structures: Dict[Tuple[str], List[str]]) -> str:
     """
     Generate a summary report based on the analysis results.
     
     Args:
     field_frequency (Dict[str, int]): Dictionary of field occurrences.
-    missing_fields (Dict[str, List[str]]): Dictionary of files with their missing fields.
-    extra_fields (Dict[str, List[str]]): Dictionary of files with their extra fields.
+    structure_differences (Dict[Tuple[str, ...], Tuple[Tuple[str, ...], Tuple[str, ...]]]): Dictionary mapping each structure to its (missing, extra) fields.
     file_structures (Dict[Tuple[str], List[str]]): Dictionary grouping files by their structure.
     
     Returns:
     str: A formatted string containing the summary report.
     """
     total_files = sum(len(files) for files in file_structures.values())
-    report = f"JSON Files Analysis Report\n"
-    report += f"Total files analyzed: {total_files}\n\n"
+    buf = io.StringIO()
+    write = buf.write
+    write("JSON Files Analysis Report\n")
+    write(f"Total files analyzed: {total_files}\n\n")
 
     # Add field frequency information to the report
-    report += "Field Frequency:\n"
-    for field, count in sorted(field_frequency.items(), key=lambda x: x[1], reverse=True):
-        report += f"  {field}: {count} ({count/total_files*100:.2f}%)\n"
+    write("Field Frequency:\n")
+    frequencies = sorted(field_frequency.items(), key=itemgetter(1), reverse=True)
+    if frequencies:
+        # Percentages for all fields in one vectorised operation
+        counts = np.fromiter((count for _, count in frequencies), dtype=np.int64, count=len(frequencies))
+        percentages = (counts / total_files * 100).tolist()
+        for (field, count), percentage in zip(frequencies, percentages):
+            write(f"  {field}: {count} ({percentage:.2f}%)\n")
 
     # Add missing fields information to the report
-    report += "\nMissing Fields:\n"
-    for file, fields in missing_fields.items():
-        report += f"  {file}: {', '.join(fields)}\n"
+    write("\nMissing Fields:\n")
+    for structure, files in file_structures.items():
+        missing = structure_differences[structure][0]
+        if missing:
+            fields = ', '.join(missing)
+            for file in files:
+                write(f"  {file}: {fields}\n")
 
     # Add extra fields information to the report
-    report += "\nExtra Fields:\n"
-    for file, fields in extra_fields.items():
-        report += f"  {file}: {', '.join(fields)}\n"
+    write("\nExtra Fields:\n")
+    for structure, files in file_structures.items():
+        extra = structure_differences[structure][1]
+        if extra:
+            fields = ', '.join(extra)
+            for file in files:
+                write(f"  {file}: {fields}\n")
 
     # Add file grouping information to the report
-    report += "\nFile Grouping:\n"
+    write("\nFile Grouping:\n")
     for i, (structure, files) in enumerate(file_structures.items(), 1):
-        report += f"  Group {i} ({len(files)} files):\n"
-        report += f"    Fields: {', '.join(structure)}\n"
-        report += f"    Files: {', '.join(files[:5])}{'...' if len(files) > 5 else ''}\n"
+        write(f"  Group {i} ({len(files)} files):\n")
+        write(f"    Fields: {', '.join(structure)}\n")
+        write(f"    Files: {', '.join(files[:5])}{'...' if len(files) > 5 else ''}\n")
 
-    return report
+    return buf.getvalue()
 
 def create_dataframes(file_data: Dict[Tuple[str], List[Tuple[str, str, Dict]]]) -> Dict[int, pd.DataFrame]:
     """
@@ -168,22 +495,40 @@ def create_dataframes(file_data: Dict[Tuple[str], List[Tuple[str, str, Dict]]])
     """
     dataframes = {}
     for i, (structure, files) in enumerate(file_data.items(), 1):
-        df_data = []
-        for file_name, file_path, data in files:
-            row = {
-                'file_name': file_name,
-                'file_path': file_path,
-                'field_names': ', '.join(sorted(data.keys())),
-                **data
-            }
-            df_data.append(row)
-        df = pd.DataFrame(df_data)
-        # Reorder columns to put field_names after file_path
-        columns = ['file_name', 'file_path', 'field_names'] + [col for col in df.columns if col not in ['file_name', 'file_path', 'field_names']]
-        df = df[columns]
-        dataframes[i] = df
+        # Every file in a group has the same fields, so the column order and
+        # the field_names value are computed once per group and rows are
+        # built as plain tuples; field_names goes right after file_path.
+        # A JSON field with one of the metadata names replaces that column's
+        # value instead of adding a duplicate column.
+        metadata_columns = ['file_name', 'file_path', 'field_names']
+        data_columns = [col for col in files[0][2] if col not in metadata_columns]
+        field_names = ', '.join(structure)
+        rows = [(data.get('file_name', file_name), data.get('file_path', file_path),
+                 data.get('field_names', field_names), *(data[col] for col in data_columns))
+                for file_name, file_path, data in files]
+        dataframes[i] = pd.DataFrame.from_records(rows, columns=metadata_columns + data_columns)
     return dataframes
 
+def save_dataframe(df: pd.DataFrame, file_path: str) -> None:
+    """
+    Save a DataFrame as CSV, using pyarrow's C++ writer when it is available.
+    
+    Falls back to pandas' to_csv when pyarrow is not installed or cannot
+    represent the frame (e.g. mixed-type object columns, duplicate column
+    names or integers wider than 64 bits).
+    
+    Args:
+    df (pd.DataFrame): The DataFrame to save.
+    file_path (str): Path of the CSV file to write.
+    """
+    if pa is not None:
+        try:
+            pacsv.write_csv(pa.Table.from_pandas(df, preserve_index=False), file_path)
+            return
+        except (pa.ArrowException, ValueError, TypeError, OverflowError):
+            pass
+    df.to_csv(file_path, index=False)
+
 def main(directory: str, report_directory: str):
     """
     Main function to orchestrate the JSON file analysis process.
@@ -195,33 +540,39 @@ def main(directory: str, report_directory: str):
     Returns:
     Dict[int, pd.DataFrame]: A dictionary of DataFrames, keyed by group number.
     """
-    # Analyze JSON files
-    field_frequency, missing_fields, extra_fields, file_structures, file_data = analyze_json_files(directory)
+    # Create the reports directory if it doesn't exist
+    os.makedirs(report_directory, exist_ok=True)
+
+    # Analyze JSON files, reusing parse results cached in the reports directory
+    cache_path = os.path.join(report_directory, CACHE_FILE_NAME)
+    field_frequency, structure_differences, file_structures, file_data = analyze_json_files(directory, cache_path)
     
     # Generate and print the summary report
-    report = generate_summary_report(field_frequency, missing_fields, extra_fields, file_structures)
+    report = generate_summary_report(field_frequency, structure_differences, file_structures)
     print(report)
 
-    # Create the reports directory if it doesn't exist
-    os.makedirs(report_directory, exist_ok=True)
-
     # Generate timestamp for the report file name
     timestamp = datetime.now().strftime("%Y%m%d-%H%M%S")
 
     # Save the report to a file in the specified directory with timestamp
     report_file_name = f'{timestamp}_json_analysis_report.txt'
     report_file_path = os.path.join(report_directory, report_file_name)
-    with open(report_file_path, 'w') as f:
-        f.write(report)
+    with open(report_file_path, 'wb', buffering=1 << 20) as f:
+        f.write(report.encode('utf-8'))
     
     print(f"Report saved to: {report_file_path}")
 
     # Create and save dataframes
     dataframes = create_dataframes(file_data)
-    for group_number, df in dataframes.items():
-        df_file_path = os.path.join(report_directory, f'group_{group_number}_dataframe.csv')
-        df.to_csv(df_file_path, index=False)
-        print(f"Group {group_number} DataFrame saved to: {df_file_path}")
+    df_file_paths = [os.path.join(report_directory, f'group_{group_number}_dataframe.csv')
+                     for group_number in dataframes]
+    # pyarrow's CSV writer and the file I/O release the GIL, so groups are
+    # written concurrently (the pandas fallback formats under the GIL and
+    # gains little); each one is reported in group order once it is saved
+    with ThreadPoolExecutor(max_workers=CSV_WRITE_WORKERS) as executor:
+        saved = executor.map(save_dataframe, dataframes.values(), df_file_paths)
+        for group_number, df_file_path, _ in zip(dataframes, df_file_paths, saved):
+            print(f"Group {group_number} DataFrame saved to: {df_file_path}")
 
     return dataframes  # Return the dataframes for potential future use
 